@@ -1,7 +1,7 @@
 from fastapi import FastAPI, Query, Request, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from datetime import datetime, timezone, timedelta
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 import asyncio
@@ -13,6 +13,13 @@ from pathlib import Path
 from collections import deque
 import subprocess
 import math
+import time
+from threading import Lock
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
 
 import mqtt_listener_control as mqtt_listener_control
 from mqtt_listener_control import start_listener
@@ -87,8 +94,29 @@ SENSOR_KEYS = ("accelerometer", "inclinometer", "temperature")
 
 # Keep raw preview plots limited to short windows to keep the backend lightweight.
 PLOT_MAX_WINDOW_MINUTES = 60
+PLOT_VALUE_NAMES = {
+    "accelerometer": ("x", "y", "z"),
+    "inclinometer": ("roll", "pitch", "yaw"),
+    "temperature": ("value",),
+}
+PLOT_POINT_LIMITS = {
+    "accelerometer": 1200,
+    "inclinometer": 1200,
+    "temperature": 2000,
+}
 FAULT_LOG_MAX_PAGES = 10
 
+# Serialized plot responses keyed by ETag, so a repeat poll against an
+# unchanged file is a lookup instead of a decode + JSON encode.
+_PLOT_RESPONSE_CACHE = {}
+_PLOT_RESPONSE_LOCK = Lock()
+_PLOT_RESPONSE_CACHE_MAX = 32
+
+# One build lock per ETag being decoded, so concurrent polls for the same
+# window share a single decode instead of each decoding the file again.
+# Waiters still hold a threadpool worker while blocked on the lock.
+_PLOT_BUILD_LOCKS = {}
+
 
 # Stateful fault types that should be reduced to current state.
 STATEFUL_FAULT_TYPES = (
@@ -1485,47 +1513,65 @@ async def fault_events(
 
 @app.get("/api/accel")
 def get_accel_data(
+    request: Request,
     node: int = Query(1, ge=1),
     minutes: int = Query(1, ge=1, le=PLOT_MAX_WINDOW_MINUTES),
     user=Depends(get_current_user),
 ):
-    pts = read_accel_points(node_id=node, minutes=minutes)
-    return {
-        "sensor": "accelerometer",
-        "unit": "g",
-        "node": node,
-        "points": pts,
-    }
+    return _cached_plot_response(
+        request,
+        "accelerometer",
+        node,
+        minutes,
+        lambda: {
+            "sensor": "accelerometer",
+            "unit": "g",
+            "node": node,
+            "columns": read_accel_points(node_id=node, minutes=minutes),
+        },
+    )
 
 
 @app.get("/api/inclinometer")
 def api_inclinometer(
+    request: Request,
     node: int = Query(1, ge=1),
     minutes: int = Query(10, ge=1, le=PLOT_MAX_WINDOW_MINUTES),
     user=Depends(get_current_user),
 ):
-    pts = read_inclinometer_points(node_id=node, minutes=minutes)
-    return {
-        "sensor": "inclinometer",
-        "unit": "deg",
-        "node": node,
-        "points": pts,
-    }
+    return _cached_plot_response(
+        request,
+        "inclinometer",
+        node,
+        minutes,
+        lambda: {
+            "sensor": "inclinometer",
+            "unit": "deg",
+            "node": node,
+            "columns": read_inclinometer_points(node_id=node, minutes=minutes),
+        },
+    )
 
 
 @app.get("/api/temperature")
 def api_temperature(
+    request: Request,
     node: int = Query(1, ge=1),
     minutes: int = Query(60, ge=1, le=PLOT_MAX_WINDOW_MINUTES),
     user=Depends(get_current_user),
 ):
-    pts = read_temperature_points(node_id=node, minutes=minutes)
-    return {
-        "sensor": "temperature",
-        "unit": "C",
-        "node": node,
-        "points": pts,
-    }
+    return _cached_plot_response(
+        request,
+        "temperature",
+        node,
+        minutes,
+        lambda: {
+            "sensor": "temperature",
+            "unit": "C",
+            "node": node,
+            "columns": read_temperature_points(node_id=node, minutes=minutes),
+        },
+    )
 
 
 def _get_plot_node_serial(node_id: int) -> str:
@@ -1540,21 +1586,13 @@ def _get_plot_node_serial(node_id: int) -> str:
     return serial
 
 
-def _plot_time_window(minutes: int) -> tuple[float, float, str, str, datetime]:
-    end_dt = datetime.now().astimezone()
-    start_dt = end_dt - timedelta(minutes=minutes)
+def _plot_time_window(minutes: int) -> tuple[float, float]:
+    end_ts = time.time()
+    return end_ts - minutes * 60, end_ts
 
-    return (
-        start_dt.timestamp(),
-        end_dt.timestamp(),
-        start_dt.isoformat(),
-        end_dt.isoformat(),
-        end_dt,
-    )
 
-
-def _current_hour_plot_file_path(serial: str, reference_dt: datetime) -> Path:
-    hour_str = reference_dt.strftime("%Y%m%d_%H")
+def _current_hour_plot_file_path(serial: str, reference_ts: float) -> Path:
+    hour_str = time.strftime("%Y%m%d_%H", time.localtime(reference_ts))
     return DATA_DIR / "data" / f"data_{serial}_{hour_str}.bin"
 
 
@@ -1564,29 +1602,110 @@ def _min_spacing_seconds(minutes: int, target_points: int) -> float:
 
 
 
+# Build a weak ETag for one plot response from the current hour file's
+# identity and size plus the window position. Hourly files are append-only,
+# so an unchanged size means no new samples; the window term lets old points
+# age out at the same granularity the readers thin to.
+def _plot_etag(sensor: str, node_id: int, minutes: int, limit: int) -> Optional[str]:
+    if not is_ssd_available():
+        return None
+
+    serial = _get_plot_node_serial(node_id)
+    _, end_ts = _plot_time_window(minutes)
+    file_path = _current_hour_plot_file_path(serial, end_ts)
+
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+
+    bucket = max(1.0, _min_spacing_seconds(minutes, limit))
+    window_key = int(end_ts // bucket)
+
+    return f'W/"{sensor}-{node_id}-{minutes}-{st.st_ino}-{st.st_size}-{window_key}"'
+
+
+# Plot payloads are the largest responses the dashboard polls for, so encode
+# them with orjson when it is installed.
+def _encode_plot_body(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return JSONResponse(payload).body
+
+
+def _cached_plot_response(request: Request, sensor: str, node_id: int, minutes: int, build):
+    limit = PLOT_POINT_LIMITS[sensor]
+    etag = _plot_etag(sensor, node_id, minutes, limit)
+    if etag is None:
+        return build()
+
+    if_none_match = request.headers.get("if-none-match") or ""
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    with _PLOT_RESPONSE_LOCK:
+        body = _PLOT_RESPONSE_CACHE.get(etag)
+        if body is None:
+            build_lock = _PLOT_BUILD_LOCKS.setdefault(etag, Lock())
+
+    if body is None:
+        with build_lock:
+            with _PLOT_RESPONSE_LOCK:
+                body = _PLOT_RESPONSE_CACHE.get(etag)
+
+            if body is None:
+                try:
+                    body = _encode_plot_body(build())
+                finally:
+                    with _PLOT_RESPONSE_LOCK:
+                        _PLOT_BUILD_LOCKS.pop(etag, None)
+                        if body is not None:
+                            while len(_PLOT_RESPONSE_CACHE) >= _PLOT_RESPONSE_CACHE_MAX:
+                                _PLOT_RESPONSE_CACHE.pop(next(iter(_PLOT_RESPONSE_CACHE)))
+                            _PLOT_RESPONSE_CACHE[etag] = body
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
 def _plot_float_or_none(value):
     if value is None:
         return None
     return float(value)
 
 
-def read_accel_points(node_id: int, minutes: int, limit: int = 1200):
+# Build the columnar plot payload: one list per field rather than one dict
+# per point, so the wire format doesn't repeat every key for every sample.
+def _plot_columns(points, value_names: tuple[str, ...]) -> Dict[str, list]:
+    columns = list(zip(*points)) or [()] * (len(value_names) + 1)
+
+    out = {"ts": [_iso_from_epoch_seconds(ts) for ts in columns[0]]}
+    for name, values in zip(value_names, columns[1:]):
+        out[name] = [_plot_float_or_none(value) for value in values]
+
+    return out
+
+
+def read_accel_points(node_id: int, minutes: int, limit: int = PLOT_POINT_LIMITS["accelerometer"]):
     if not is_ssd_available():
-        return []
+        return _plot_columns((), PLOT_VALUE_NAMES["accelerometer"])
 
     serial = _get_plot_node_serial(node_id)
-    start_ts, end_ts, _, _, end_dt = _plot_time_window(minutes)
+    start_ts, end_ts = _plot_time_window(minutes)
 
-    file_path = _current_hour_plot_file_path(serial, end_dt)
+    file_path = _current_hour_plot_file_path(serial, end_ts)
 
     if not file_path.exists():
-        return []
+        return _plot_columns((), PLOT_VALUE_NAMES["accelerometer"])
 
     points = deque(maxlen=limit)
     min_spacing = _min_spacing_seconds(minutes, limit)
     last_kept_ts = None
 
-    for rec in iter_decoded_records_for_export(str(file_path)):
+    for rec in iter_decoded_records_for_export(str(file_path), start_ts=start_ts):
         accel_samples = rec.get("accel_samples")
         if not accel_samples:
             continue
@@ -1598,37 +1717,30 @@ def read_accel_points(node_id: int, minutes: int, limit: int = 1200):
             if last_kept_ts is not None and (ts - last_kept_ts) < min_spacing:
                 continue
 
-            points.append(
-                {
-                    "ts": _iso_from_epoch_seconds(ts),
-                    "x": _plot_float_or_none(x),
-                    "y": _plot_float_or_none(y),
-                    "z": _plot_float_or_none(z),
-                }
-            )
-
+            points.append((ts, x, y, z))
             last_kept_ts = ts
 
-    return list(points)
+    # Format timestamps only for the points that survived the window and spacing filters.
+    return _plot_columns(points, PLOT_VALUE_NAMES["accelerometer"])
 
 
-def read_inclinometer_points(node_id: int, minutes: int, limit: int = 1200):
+def read_inclinometer_points(node_id: int, minutes: int, limit: int = PLOT_POINT_LIMITS["inclinometer"]):
     if not is_ssd_available():
-        return []
+        return _plot_columns((), PLOT_VALUE_NAMES["inclinometer"])
 
     serial = _get_plot_node_serial(node_id)
-    start_ts, end_ts, _, _, end_dt = _plot_time_window(minutes)
+    start_ts, end_ts = _plot_time_window(minutes)
 
-    file_path = _current_hour_plot_file_path(serial, end_dt)
+    file_path = _current_hour_plot_file_path(serial, end_ts)
 
     if not file_path.exists():
-        return []
+        return _plot_columns((), PLOT_VALUE_NAMES["inclinometer"])
 
     points = deque(maxlen=limit)
     min_spacing = _min_spacing_seconds(minutes, limit)
     last_kept_ts = None
 
-    for rec in iter_decoded_records_for_export(str(file_path)):
+    for rec in iter_decoded_records_for_export(str(file_path), start_ts=start_ts):
         inclin = rec.get("inclin")
         if not inclin:
             continue
@@ -1642,34 +1754,29 @@ def read_inclinometer_points(node_id: int, minutes: int, limit: int = 1200):
             if last_kept_ts is not None and (ts - last_kept_ts) < min_spacing:
                 continue
 
-            points.append(
-                {
-                    "ts": _iso_from_epoch_seconds(ts),
-                    "roll": _plot_float_or_none(roll),
-                    "pitch": _plot_float_or_none(pitch),
-                    "yaw": _plot_float_or_none(yaw),
-                }
-            )
+            points.append((ts, roll, pitch, yaw))
             last_kept_ts = ts
 
-    return list(points)
+    return _plot_columns(points, PLOT_VALUE_NAMES["inclinometer"])
 
 
-def read_temperature_points(node_id: int, minutes: int, limit: int = 2000):
+def read_temperature_points(node_id: int, minutes: int, limit: int = PLOT_POINT_LIMITS["temperature"]):
     if not is_ssd_available():
-        return []
+        return _plot_columns((), PLOT_VALUE_NAMES["temperature"])
 
     serial = _get_plot_node_serial(node_id)
-    start_ts, end_ts, _, _, end_dt = _plot_time_window(minutes)
+    start_ts, end_ts = _plot_time_window(minutes)
 
-    file_path = _current_hour_plot_file_path(serial, end_dt)
+    file_path = _current_hour_plot_file_path(serial, end_ts)
 
     if not file_path.exists():
-        return []
+        return _plot_columns((), PLOT_VALUE_NAMES["temperature"])
 
     points = deque(maxlen=limit)
+    min_spacing = _min_spacing_seconds(minutes, limit)
+    last_kept_ts = None
 
-    for rec in iter_decoded_records_for_export(str(file_path)):
+    for rec in iter_decoded_records_for_export(str(file_path), start_ts=start_ts):
         temp = rec.get("temp")
         if not temp:
             continue
@@ -1678,11 +1785,12 @@ def read_temperature_points(node_id: int, minutes: int, limit: int = 2000):
         if ts < start_ts or ts >= end_ts:
             continue
 
-        points.append(
-            {
-                "ts": _iso_from_epoch_seconds(ts),
-                "value": _plot_float_or_none(value),
-            }
-        )
+        # Thin to the window like the other sensors so the oldest part of a
+        # long window is not pushed out of the deque.
+        if last_kept_ts is not None and (ts - last_kept_ts) < min_spacing:
+            continue
+
+        points.append((ts, value))
+        last_kept_ts = ts
 
-    return list(points)
+    return _plot_columns(points, PLOT_VALUE_NAMES["temperature"])
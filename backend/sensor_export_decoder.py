@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import bisect
 import gzip
-import io
+import os
 import struct
-from contextlib import ExitStack, contextmanager
+from threading import Lock
 from typing import Dict, Generator, Any
 
 TEMP_SCALE = 100
@@ -22,17 +23,42 @@ FORMAT_V3 = 3
 
 INT32_NAN_SENTINEL = -2147483648
 
+# Field layouts, compiled once so the per-record decoders don't re-parse
+# the format string on every call.
+_I16 = struct.Struct("<h")
+_I32 = struct.Struct("<i")
+_I16X3 = struct.Struct("<hhh")
+_ABS_SAMPLE = struct.Struct("<qiii")
+_ABS_TEMP = struct.Struct("<qi")
 
-def read_bytes(f, n, label=""):
-    d = f.read(n)
-    if len(d) < n:
-        raise EOFError(f"EOF reading {label!r}: got {len(d)}/{n} bytes")
-    return d
+# Size of one absolute sample: ts(q) + three int32 values.
+ABS_SAMPLE_SIZE = _ABS_SAMPLE.size
 
+# Contents of recently read .bin files, keyed by path -> ((inode, size), bytes).
+# Hourly files are append-only, so an entry stays valid until the file grows.
+# Kept small: unlike page-cache pages, each entry is a full copy in memory.
+_RECORD_FILE_CACHE = {}
+_RECORD_FILE_LOCK = Lock()
+_RECORD_FILE_CACHE_MAX = 4
 
-def read_fmt(f, fmt, label=""):
-    raw = read_bytes(f, struct.calcsize(fmt), label)
-    return struct.unpack(fmt, raw)
+# Per-file checkpoints at ABSOLUTE records, used to skip straight to the
+# requested plot window instead of decoding the file from the start.
+_RECORD_INDEX_CACHE = {}
+_RECORD_INDEX_LOCK = Lock()
+_RECORD_INDEX_CACHE_MAX = 16
+
+
+# The record decoders below work on one in-memory buffer and take/return the
+# current byte offset, so each field is a single struct.unpack_from() call
+# instead of a stream read plus a temporary bytes object per field.
+# A truncated buffer surfaces as EOFError, struct.error or IndexError.
+
+
+def read_bytes(buf, pos, n, label=""):
+    end = pos + n
+    if end > len(buf):
+        raise EOFError(f"EOF reading {label!r}: got {max(0, len(buf) - pos)}/{n} bytes")
+    return buf[pos:end], end
 
 
 def _fresh_sensor_state():
@@ -52,39 +78,33 @@ def _fresh_decode_state():
     }
 
 
-def _reconstruct_abs_ts(f, ss: dict) -> int:
-    (ts_us,) = read_fmt(f, "<q", "abs timestamp")
-    ss["ts_us"] = ts_us
-    return ts_us
-
-
 def _decode_abs_value(raw: int, scale: int):
     if raw == INT32_NAN_SENTINEL:
         return None
     return raw / scale
 
 
-def _v1_reconstruct_ts(f, ss: dict) -> int:
-    (dod,) = read_fmt(f, "<i", "v1 dod_ts")
+def _v1_reconstruct_ts(buf, pos, ss: dict) -> tuple[int, int]:
+    (dod,) = _I32.unpack_from(buf, pos)
     delta_us = ss.get("ts_delta_prev", 0) + dod
     ts_us = ss["ts_us"] + delta_us
     ss["ts_us"] = ts_us
     ss["ts_delta_prev"] = delta_us
-    return ts_us
+    return ts_us, pos + 4
 
 
-def _decode_accel_abs(f, state):
-    (n,) = read_fmt(f, "<B", "accel n")
+def _decode_xyz_abs(buf, pos, ss: dict, scale: int):
+    n = buf[pos]
+    raw, pos = read_bytes(buf, pos + 1, n * ABS_SAMPLE_SIZE, "abs samples")
     out = []
-    prev = list(state["accel"]["xyz_prev"])
-
-    for _ in range(n):
-        ts_us = _reconstruct_abs_ts(f, state["accel"])
-        x, y, z = read_fmt(f, "<iii", "accel abs xyz")
+    prev = list(ss["xyz_prev"])
+    ts_us = ss["ts_us"]
 
-        x_value = _decode_abs_value(x, ACCEL_SCALE)
-        y_value = _decode_abs_value(y, ACCEL_SCALE)
-        z_value = _decode_abs_value(z, ACCEL_SCALE)
+    # Absolute samples are fixed-size, so the whole block unpacks in one call.
+    for ts_us, x, y, z in _ABS_SAMPLE.iter_unpack(raw):
+        x_value = _decode_abs_value(x, scale)
+        y_value = _decode_abs_value(y, scale)
+        z_value = _decode_abs_value(z, scale)
 
         if x_value is not None:
             prev[0] = x
@@ -102,205 +122,172 @@ def _decode_accel_abs(f, state):
             )
         )
 
-    state["accel"]["xyz_prev"] = prev
-    return out or None
-
-
-def _decode_accel_delta_v1(f, state):
-    (n,) = read_fmt(f, "<B", "accel n")
-    out = []
-    ss = state["accel"]
-    prev = ss["xyz_prev"]
-
-    for _ in range(n):
-        ts_us = _v1_reconstruct_ts(f, ss)
-        dx, dy, dz = read_fmt(f, "<hhh", "accel delta xyz")
-        cur = [prev[0] + dx, prev[1] + dy, prev[2] + dz]
-
-        out.append(
-            (
-                ts_us / TS_SCALE,
-                cur[0] / ACCEL_SCALE,
-                cur[1] / ACCEL_SCALE,
-                cur[2] / ACCEL_SCALE,
-            )
-        )
-
-        prev = cur
-
+    ss["ts_us"] = ts_us
     ss["xyz_prev"] = prev
-    return out or None
+    return out or None, pos
 
 
-def _decode_accel_delta(f, state):
-    (n,) = read_fmt(f, "<B", "accel n")
+def _decode_xyz_delta(buf, pos, n: int, ss: dict, scale: int):
     out = []
-    ss = state["accel"]
-    prev = ss["xyz_prev"]
+    ts_us = ss["ts_us"]
+    px, py, pz = ss["xyz_prev"]
 
     for _ in range(n):
-        (changed,) = read_fmt(f, "<B", "accel changed")
+        changed = buf[pos]
+        pos += 1
 
         if changed & 0x01:
-            (delta_us,) = read_fmt(f, "<i", "accel delta_ts")
-            ts_us = ss["ts_us"] + delta_us
-            ss["ts_us"] = ts_us
-        else:
-            ts_us = ss["ts_us"]
-
-        dx = read_fmt(f, "<h", "accel dx")[0] if changed & 0x02 else 0
-        dy = read_fmt(f, "<h", "accel dy")[0] if changed & 0x04 else 0
-        dz = read_fmt(f, "<h", "accel dz")[0] if changed & 0x08 else 0
-
-        cur = [prev[0] + dx, prev[1] + dy, prev[2] + dz]
+            (delta_us,) = _I32.unpack_from(buf, pos)
+            pos += 4
+            ts_us += delta_us
+
+        if changed & 0x02:
+            (dx,) = _I16.unpack_from(buf, pos)
+            pos += 2
+            px += dx
+        if changed & 0x04:
+            (dy,) = _I16.unpack_from(buf, pos)
+            pos += 2
+            py += dy
+        if changed & 0x08:
+            (dz,) = _I16.unpack_from(buf, pos)
+            pos += 2
+            pz += dz
 
         out.append(
             (
                 ts_us / TS_SCALE,
-                cur[0] / ACCEL_SCALE,
-                cur[1] / ACCEL_SCALE,
-                cur[2] / ACCEL_SCALE,
+                px / scale,
+                py / scale,
+                pz / scale,
             )
         )
 
-        prev = cur
-
-    ss["xyz_prev"] = prev
-    return out or None
-
+    ss["ts_us"] = ts_us
+    ss["xyz_prev"] = [px, py, pz]
+    return out, pos
 
 
-def _decode_accel_delta_v3(f, state):
-    (n,) = read_fmt(f, "<B", "accel n")
+def _decode_xyz_delta_v3(buf, pos, n: int, ss: dict, scale: int):
     out = []
-    ss = state["accel"]
-    prev = ss["xyz_prev"]
+    ts_us = ss["ts_us"]
+    px, py, pz = ss["xyz_prev"]
 
     for _ in range(n):
-        (changed,) = read_fmt(f, "<B", "accel changed")
+        changed = buf[pos]
+        pos += 1
 
         if changed & 0x01:
-            (delta_us,) = read_fmt(f, "<i", "accel delta_ts")
-            ts_us = ss["ts_us"] + delta_us
-            ss["ts_us"] = ts_us
-        else:
-            ts_us = ss["ts_us"]
+            (delta_us,) = _I32.unpack_from(buf, pos)
+            pos += 4
+            ts_us += delta_us
 
+        # NaN flags carry no delta and keep the previous value for the next sample.
         if changed & 0x10:
             x = None
         else:
-            dx = read_fmt(f, "<h", "accel dx")[0] if changed & 0x02 else 0
-            x = prev[0] + dx
+            if changed & 0x02:
+                (dx,) = _I16.unpack_from(buf, pos)
+                pos += 2
+                px += dx
+            x = px / scale
 
         if changed & 0x20:
             y = None
         else:
-            dy = read_fmt(f, "<h", "accel dy")[0] if changed & 0x04 else 0
-            y = prev[1] + dy
+            if changed & 0x04:
+                (dy,) = _I16.unpack_from(buf, pos)
+                pos += 2
+                py += dy
+            y = py / scale
 
         if changed & 0x40:
             z = None
         else:
-            dz = read_fmt(f, "<h", "accel dz")[0] if changed & 0x08 else 0
-            z = prev[2] + dz
+            if changed & 0x08:
+                (dz,) = _I16.unpack_from(buf, pos)
+                pos += 2
+                pz += dz
+            z = pz / scale
 
         out.append(
             (
                 ts_us / TS_SCALE,
-                None if x is None else x / ACCEL_SCALE,
-                None if y is None else y / ACCEL_SCALE,
-                None if z is None else z / ACCEL_SCALE,
+                x,
+                y,
+                z,
             )
         )
 
-        prev = [
-            prev[0] if x is None else x,
-            prev[1] if y is None else y,
-            prev[2] if z is None else z,
-        ]
-
-    ss["xyz_prev"] = prev
-    return out or None
+    ss["ts_us"] = ts_us
+    ss["xyz_prev"] = [px, py, pz]
+    return out, pos
 
 
-def _decode_inclin_abs(f, state):
-    ts_us = _reconstruct_abs_ts(f, state["inclin"])
-    roll, pitch, yaw = read_fmt(f, "<iii", "inclin abs")
-    state["inclin"]["xyz_prev"] = [roll, pitch, yaw]
+def _decode_accel_abs(buf, pos, state):
+    return _decode_xyz_abs(buf, pos, state["accel"], ACCEL_SCALE)
 
-    return (
-        ts_us / TS_SCALE,
-        roll / INCLIN_SCALE,
-        pitch / INCLIN_SCALE,
-        yaw / INCLIN_SCALE,
-    )
 
-
-def _decode_inclin_abs_v3(f, state):
-    (n,) = read_fmt(f, "<B", "inclin n")
+def _decode_accel_delta_v1(buf, pos, state):
+    n = buf[pos]
+    pos += 1
     out = []
-    prev = list(state["inclin"]["xyz_prev"])
+    ss = state["accel"]
+    prev = ss["xyz_prev"]
 
     for _ in range(n):
-        ts_us = _reconstruct_abs_ts(f, state["inclin"])
-        roll, pitch, yaw = read_fmt(f, "<iii", "inclin abs")
-
-        roll_value = _decode_abs_value(roll, INCLIN_SCALE)
-        pitch_value = _decode_abs_value(pitch, INCLIN_SCALE)
-        yaw_value = _decode_abs_value(yaw, INCLIN_SCALE)
-
-        if roll_value is not None:
-            prev[0] = roll
-        if pitch_value is not None:
-            prev[1] = pitch
-        if yaw_value is not None:
-            prev[2] = yaw
+        ts_us, pos = _v1_reconstruct_ts(buf, pos, ss)
+        dx, dy, dz = _I16X3.unpack_from(buf, pos)
+        pos += 6
+        cur = [prev[0] + dx, prev[1] + dy, prev[2] + dz]
 
         out.append(
             (
                 ts_us / TS_SCALE,
-                roll_value,
-                pitch_value,
-                yaw_value,
+                cur[0] / ACCEL_SCALE,
+                cur[1] / ACCEL_SCALE,
+                cur[2] / ACCEL_SCALE,
             )
         )
 
-    state["inclin"]["xyz_prev"] = prev
-    return out or None
+        prev = cur
 
+    ss["xyz_prev"] = prev
+    return out or None, pos
+
+
+def _decode_accel_delta(buf, pos, state):
+    out, pos = _decode_xyz_delta(buf, pos + 1, buf[pos], state["accel"], ACCEL_SCALE)
+    return out or None, pos
 
-def _decode_inclin_delta_v1(f, state):
-    ss = state["inclin"]
-    ts_us = _v1_reconstruct_ts(f, ss)
-    dr, dp, dy = read_fmt(f, "<hhh", "inclin delta")
-    prev = ss["xyz_prev"]
-    cur = [prev[0] + dr, prev[1] + dp, prev[2] + dy]
-    ss["xyz_prev"] = cur
+
+def _decode_accel_delta_v3(buf, pos, state):
+    out, pos = _decode_xyz_delta_v3(buf, pos + 1, buf[pos], state["accel"], ACCEL_SCALE)
+    return out or None, pos
+
+
+def _decode_inclin_abs(buf, pos, state):
+    ts_us, roll, pitch, yaw = _ABS_SAMPLE.unpack_from(buf, pos)
+    state["inclin"]["ts_us"] = ts_us
+    state["inclin"]["xyz_prev"] = [roll, pitch, yaw]
 
     return (
         ts_us / TS_SCALE,
-        cur[0] / INCLIN_SCALE,
-        cur[1] / INCLIN_SCALE,
-        cur[2] / INCLIN_SCALE,
-    )
+        roll / INCLIN_SCALE,
+        pitch / INCLIN_SCALE,
+        yaw / INCLIN_SCALE,
+    ), pos + ABS_SAMPLE_SIZE
 
 
-def _decode_inclin_delta(f, state):
-    ss = state["inclin"]
-    (changed,) = read_fmt(f, "<B", "inclin changed")
+def _decode_inclin_abs_v3(buf, pos, state):
+    return _decode_xyz_abs(buf, pos, state["inclin"], INCLIN_SCALE)
 
-    if changed & 0x01:
-        (delta_us,) = read_fmt(f, "<i", "inclin delta_ts")
-        ts_us = ss["ts_us"] + delta_us
-        ss["ts_us"] = ts_us
-    else:
-        ts_us = ss["ts_us"]
 
+def _decode_inclin_delta_v1(buf, pos, state):
+    ss = state["inclin"]
+    ts_us, pos = _v1_reconstruct_ts(buf, pos, ss)
+    dr, dp, dy = _I16X3.unpack_from(buf, pos)
     prev = ss["xyz_prev"]
-    dr = read_fmt(f, "<h", "inclin dr")[0] if changed & 0x02 else 0
-    dp = read_fmt(f, "<h", "inclin dp")[0] if changed & 0x04 else 0
-    dy = read_fmt(f, "<h", "inclin dy")[0] if changed & 0x08 else 0
-
     cur = [prev[0] + dr, prev[1] + dp, prev[2] + dy]
     ss["xyz_prev"] = cur
 
@@ -309,66 +296,23 @@ def _decode_inclin_delta(f, state):
         cur[0] / INCLIN_SCALE,
         cur[1] / INCLIN_SCALE,
         cur[2] / INCLIN_SCALE,
-    )
+    ), pos + 6
 
 
+def _decode_inclin_delta(buf, pos, state):
+    # v2 inclinometer deltas are a single changed-mask sample with no count byte.
+    out, pos = _decode_xyz_delta(buf, pos, 1, state["inclin"], INCLIN_SCALE)
+    return out[0], pos
 
-def _decode_inclin_delta_v3(f, state):
-    (n,) = read_fmt(f, "<B", "inclin n")
-    out = []
-    ss = state["inclin"]
-    prev = ss["xyz_prev"]
-
-    for _ in range(n):
-        (changed,) = read_fmt(f, "<B", "inclin changed")
-
-        if changed & 0x01:
-            (delta_us,) = read_fmt(f, "<i", "inclin delta_ts")
-            ts_us = ss["ts_us"] + delta_us
-            ss["ts_us"] = ts_us
-        else:
-            ts_us = ss["ts_us"]
 
-        if changed & 0x10:
-            roll = None
-        else:
-            dr = read_fmt(f, "<h", "inclin dr")[0] if changed & 0x02 else 0
-            roll = prev[0] + dr
+def _decode_inclin_delta_v3(buf, pos, state):
+    out, pos = _decode_xyz_delta_v3(buf, pos + 1, buf[pos], state["inclin"], INCLIN_SCALE)
+    return out or None, pos
 
-        if changed & 0x20:
-            pitch = None
-        else:
-            dp = read_fmt(f, "<h", "inclin dp")[0] if changed & 0x04 else 0
-            pitch = prev[1] + dp
 
-        if changed & 0x40:
-            yaw = None
-        else:
-            dy = read_fmt(f, "<h", "inclin dy")[0] if changed & 0x08 else 0
-            yaw = prev[2] + dy
-
-        out.append(
-            (
-                ts_us / TS_SCALE,
-                None if roll is None else roll / INCLIN_SCALE,
-                None if pitch is None else pitch / INCLIN_SCALE,
-                None if yaw is None else yaw / INCLIN_SCALE,
-            )
-        )
-
-        prev = [
-            prev[0] if roll is None else roll,
-            prev[1] if pitch is None else pitch,
-            prev[2] if yaw is None else yaw,
-        ]
-
-    ss["xyz_prev"] = prev
-    return out or None
-
-
-def _decode_temp_abs(f, state):
-    ts_us = _reconstruct_abs_ts(f, state["temp"])
-    (val,) = read_fmt(f, "<i", "temp abs")
+def _decode_temp_abs(buf, pos, state):
+    ts_us, val = _ABS_TEMP.unpack_from(buf, pos)
+    state["temp"]["ts_us"] = ts_us
 
     value = _decode_abs_value(val, TEMP_SCALE)
     if value is not None:
@@ -377,190 +321,375 @@ def _decode_temp_abs(f, state):
     return (
         ts_us / TS_SCALE,
         value,
-    )
+    ), pos + 12
 
 
-def _decode_temp_delta_v1(f, state):
+def _decode_temp_delta_v1(buf, pos, state):
     ss = state["temp"]
-    ts_us = _v1_reconstruct_ts(f, ss)
-    (dt,) = read_fmt(f, "<h", "temp delta")
+    ts_us, pos = _v1_reconstruct_ts(buf, pos, ss)
+    (dt,) = _I16.unpack_from(buf, pos)
     val = ss["val_prev"] + dt
     ss["val_prev"] = val
 
     return (
         ts_us / TS_SCALE,
         val / TEMP_SCALE,
-    )
+    ), pos + 2
 
 
-def _decode_temp_delta(f, state):
+def _decode_temp_delta(buf, pos, state):
     ss = state["temp"]
-    (changed,) = read_fmt(f, "<B", "temp changed")
+    changed = buf[pos]
+    pos += 1
 
     if changed & 0x01:
-        (delta_us,) = read_fmt(f, "<i", "temp delta_ts")
-        ts_us = ss["ts_us"] + delta_us
-        ss["ts_us"] = ts_us
-    else:
-        ts_us = ss["ts_us"]
+        (delta_us,) = _I32.unpack_from(buf, pos)
+        pos += 4
+        ss["ts_us"] += delta_us
 
     if changed & 0x02:
-        (dt,) = read_fmt(f, "<h", "temp dval")
-        ss["val_prev"] = ss["val_prev"] + dt
+        (dt,) = _I16.unpack_from(buf, pos)
+        pos += 2
+        ss["val_prev"] += dt
 
     return (
-        ts_us / TS_SCALE,
+        ss["ts_us"] / TS_SCALE,
         ss["val_prev"] / TEMP_SCALE,
-    )
+    ), pos
 
 
-def _decode_temp_delta_v3(f, state):
+def _decode_temp_delta_v3(buf, pos, state):
     ss = state["temp"]
-    (changed,) = read_fmt(f, "<B", "temp changed")
+    changed = buf[pos]
+    pos += 1
 
     if changed & 0x01:
-        (delta_us,) = read_fmt(f, "<i", "temp delta_ts")
-        ts_us = ss["ts_us"] + delta_us
-        ss["ts_us"] = ts_us
-    else:
-        ts_us = ss["ts_us"]
+        (delta_us,) = _I32.unpack_from(buf, pos)
+        pos += 4
+        ss["ts_us"] += delta_us
 
     if changed & 0x04:
         return (
-            ts_us / TS_SCALE,
+            ss["ts_us"] / TS_SCALE,
             None,
-        )
+        ), pos
 
     if changed & 0x02:
-        (dt,) = read_fmt(f, "<h", "temp dval")
-        ss["val_prev"] = ss["val_prev"] + dt
+        (dt,) = _I16.unpack_from(buf, pos)
+        pos += 2
+        ss["val_prev"] += dt
 
     return (
-        ts_us / TS_SCALE,
+        ss["ts_us"] / TS_SCALE,
         ss["val_prev"] / TEMP_SCALE,
-    )
+    ), pos
+
+
+def _read_record_file(filepath: str) -> bytes:
+    """
+    Return the contents of an uncompressed raw sensor file.
 
+    The bytes are reused while the file keeps the same inode and size, so
+    concurrent plot requests for one node share a single read instead of
+    each reading the file again.
 
-@contextmanager
-def open_record_stream(filepath: str):
+    The file is read rather than memory-mapped on purpose. The active hourly
+    file can be truncated in place (encoder_storage recovery on listener
+    restart) and the SSD can disappear; with a map either one turns into
+    SIGBUS and kills the backend, while read() raises an OSError the
+    endpoints already handle.
     """
-    Streaming opener for raw sensor files used by plotting.
+    st = os.stat(filepath)
+    key = (st.st_ino, st.st_size)
+
+    with _RECORD_FILE_LOCK:
+        cached = _RECORD_FILE_CACHE.get(filepath)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+    with open(filepath, "rb") as f:
+        # The whole file is read front to back; let readahead run ahead of it.
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        data = f.read()
+
+    # The file may have grown between stat() and read(); key by what was read.
+    key = (st.st_ino, len(data))
+
+    with _RECORD_FILE_LOCK:
+        # A grown file keeps its slot; only a new path prunes rotated files.
+        if _RECORD_FILE_CACHE.pop(filepath, None) is None:
+            for stale_path in [path for path in _RECORD_FILE_CACHE if not os.path.exists(path)]:
+                del _RECORD_FILE_CACHE[stale_path]
+            while len(_RECORD_FILE_CACHE) >= _RECORD_FILE_CACHE_MAX:
+                del _RECORD_FILE_CACHE[next(iter(_RECORD_FILE_CACHE))]
+        _RECORD_FILE_CACHE[filepath] = (key, data)
+
+    return data
+
+
+def read_record_buffer(filepath: str):
+    """
+    Return the contents of a raw sensor file used by plotting.
 
     Supported:
     - .bin
-    - .bin.gz
+    - .bin.gz (decompressed into memory)
 
-    This matches the frontend decoder's file support while keeping backend
-    RAM usage low by streaming instead of fully decompressing into memory.
+    This matches the frontend decoder's file support.
     """
-    with ExitStack() as stack:
-        if filepath.endswith(".gz") or filepath.endswith(".gzip"):
-            gzip_file = stack.enter_context(gzip.open(filepath, "rb"))
-            buffered = io.BufferedReader(gzip_file)
-            yield buffered
-        else:
-            raw_file = stack.enter_context(open(filepath, "rb"))
-            buffered = io.BufferedReader(raw_file)
-            yield buffered
+    if filepath.endswith(".gz") or filepath.endswith(".gzip"):
+        with open(filepath, "rb") as raw:
+            # Archives are always inflated start to finish.
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(raw.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            with gzip.GzipFile(fileobj=raw, mode="rb") as f:
+                return f.read()
+
+    return _read_record_file(filepath)
 
 
 def iter_decoded_records_for_export(
     filepath: str,
+    start_ts: float | None = None,
 ) -> Generator[Dict[str, Any], None, None]:
     """
-    Streaming decoder used by the backend plot endpoints.
+    Decoder used by the backend plot endpoints.
 
     This now matches the frontend decoder behavior more closely:
     - supports .bin and .bin.gz
     - supports FORMAT_V1, FORMAT_V2, and FORMAT_V3
     - tolerates a truncated tail record by stopping cleanly
-    - yields one decoded record at a time for low-memory processing
+    - yields one decoded record at a time
+
+    The file is read (or decompressed) once and decoded with offset-based
+    unpacking. An hourly file is a few MB, and per-field stream reads were
+    the dominant cost of every plot request.
+
+    When start_ts is given, decoding resumes from the last ABSOLUTE record
+    that has no samples at or after start_ts before it, using a per-file
+    index built on earlier calls. Records before that point are skipped, so
+    callers must still filter samples by timestamp. DELTA records depend on
+    the state before them, so the file cannot be decoded backwards from the
+    tail; the checkpoint index is what bounds a short window's cost to the
+    records after the nearest ABSOLUTE record (at most ~60 s of lead-in).
 
     Export no longer uses this path. Raw export packages the storage files
     directly without decoding.
     """
-    state = _fresh_decode_state()
-
-    with open_record_stream(filepath) as f:
-        ver = f.read(1)
-        if not ver:
-            return
-
-        fv = ver[0]
-        if fv not in (FORMAT_V1, FORMAT_V2, FORMAT_V3):
-            # Legacy file with no explicit version byte.
-            f.seek(-1, 1)
-            fv = FORMAT_V1
-
-        idx = 0
-
-        while True:
-            b = f.read(1)
-            if not b:
-                break
-
-            sentinel = b[0]
-
-            try:
-                if sentinel == SENTINEL:
-                    (header,) = read_fmt(f, "<B", "abs header")
-                    rec = {
-                        "record_index": idx,
-                        "record_type": "ABSOLUTE",
-                        "accel_samples": None,
-                        "inclin": None,
-                        "temp": None,
-                    }
+    buf = read_record_buffer(filepath)
+
+    if start_ts is None:
+        yield from iter_decoded_records_from_buffer(buf)
+        return
+
+    yield from _iter_indexed_records(filepath, buf, start_ts)
+
+
+def iter_decoded_records_from_buffer(
+    buf,
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Decode records from an in-memory copy of a raw sensor file.
+
+    Accepts anything supporting the buffer protocol (bytes, memoryview, mmap).
+    """
+    if not buf:
+        return
+
+    fv, pos = _read_format_version(buf)
+
+    for _, rec, _ in _iter_records(buf, pos, fv, _fresh_decode_state(), 0):
+        yield rec
 
+
+def _read_format_version(buf) -> tuple[int, int]:
+    fv = buf[0]
+    if fv not in (FORMAT_V1, FORMAT_V2, FORMAT_V3):
+        # Legacy file with no explicit version byte.
+        return FORMAT_V1, 0
+    return fv, 1
+
+
+def _copy_decode_state(state: dict) -> dict:
+    return {
+        name: {**ss, "xyz_prev": list(ss["xyz_prev"])}
+        for name, ss in state.items()
+    }
+
+
+def _iter_records(buf, pos: int, fv: int, state: dict, idx: int):
+    """
+    Yield (record_offset, record, checkpoint_state) from pos to the end of buf.
+
+    checkpoint_state is a copy of the decoder state taken just before an
+    ABSOLUTE record, and None for DELTA records.
+    """
+    size = len(buf)
+
+    while pos < size:
+        record_offset = pos
+        sentinel = buf[pos]
+        pos += 1
+        checkpoint_state = None
+
+        try:
+            if sentinel == SENTINEL:
+                checkpoint_state = _copy_decode_state(state)
+                header = buf[pos]
+                pos += 1
+                rec = {
+                    "record_index": idx,
+                    "record_type": "ABSOLUTE",
+                    "accel_samples": None,
+                    "inclin": None,
+                    "temp": None,
+                }
+
+                if header & FLAG_ACCEL:
+                    rec["accel_samples"], pos = _decode_accel_abs(buf, pos, state)
+                if header & FLAG_INCLIN:
+                    if fv == FORMAT_V3:
+                        rec["inclin"], pos = _decode_inclin_abs_v3(buf, pos, state)
+                    else:
+                        rec["inclin"], pos = _decode_inclin_abs(buf, pos, state)
+                if header & FLAG_TEMP:
+                    rec["temp"], pos = _decode_temp_abs(buf, pos, state)
+            else:
+                header = sentinel
+                rec = {
+                    "record_index": idx,
+                    "record_type": "DELTA",
+                    "accel_samples": None,
+                    "inclin": None,
+                    "temp": None,
+                }
+
+                if fv == FORMAT_V1:
                     if header & FLAG_ACCEL:
-                        rec["accel_samples"] = _decode_accel_abs(f, state)
+                        rec["accel_samples"], pos = _decode_accel_delta_v1(buf, pos, state)
                     if header & FLAG_INCLIN:
-                        if fv == FORMAT_V3:
-                            rec["inclin"] = _decode_inclin_abs_v3(f, state)
-                        else:
-                            rec["inclin"] = _decode_inclin_abs(f, state)
+                        rec["inclin"], pos = _decode_inclin_delta_v1(buf, pos, state)
                     if header & FLAG_TEMP:
-                        rec["temp"] = _decode_temp_abs(f, state)
+                        rec["temp"], pos = _decode_temp_delta_v1(buf, pos, state)
+                elif fv == FORMAT_V2:
+                    if header & FLAG_ACCEL:
+                        rec["accel_samples"], pos = _decode_accel_delta(buf, pos, state)
+                    if header & FLAG_INCLIN:
+                        rec["inclin"], pos = _decode_inclin_delta(buf, pos, state)
+                    if header & FLAG_TEMP:
+                        rec["temp"], pos = _decode_temp_delta(buf, pos, state)
                 else:
-                    header = sentinel
-                    rec = {
-                        "record_index": idx,
-                        "record_type": "DELTA",
-                        "accel_samples": None,
-                        "inclin": None,
-                        "temp": None,
-                    }
-
-                    if fv == FORMAT_V1:
-                        if header & FLAG_ACCEL:
-                            rec["accel_samples"] = _decode_accel_delta_v1(f, state)
-                        if header & FLAG_INCLIN:
-                            rec["inclin"] = _decode_inclin_delta_v1(f, state)
-                        if header & FLAG_TEMP:
-                            rec["temp"] = _decode_temp_delta_v1(f, state)
-                    elif fv == FORMAT_V2:
-                        if header & FLAG_ACCEL:
-                            rec["accel_samples"] = _decode_accel_delta(f, state)
-                        if header & FLAG_INCLIN:
-                            rec["inclin"] = _decode_inclin_delta(f, state)
-                        if header & FLAG_TEMP:
-                            rec["temp"] = _decode_temp_delta(f, state)
-                    else:
-                        if header & FLAG_ACCEL:
-                            rec["accel_samples"] = _decode_accel_delta_v3(f, state)
-                        if header & FLAG_INCLIN:
-                            rec["inclin"] = _decode_inclin_delta_v3(f, state)
-                        if header & FLAG_TEMP:
-                            rec["temp"] = _decode_temp_delta_v3(f, state)
-
-                yield rec
-                idx += 1
-
-            except EOFError:
-                # Match the frontend decoder behavior:
-                # keep all earlier decoded records and stop cleanly if the file
-                # ends mid-record, which can happen for active .bin files or
-                # interrupted/incomplete files.
-                break
-            except struct.error:
-                break
\ No newline at end of file
+                    if header & FLAG_ACCEL:
+                        rec["accel_samples"], pos = _decode_accel_delta_v3(buf, pos, state)
+                    if header & FLAG_INCLIN:
+                        rec["inclin"], pos = _decode_inclin_delta_v3(buf, pos, state)
+                    if header & FLAG_TEMP:
+                        rec["temp"], pos = _decode_temp_delta_v3(buf, pos, state)
+
+        except (EOFError, struct.error, IndexError):
+            # Match the frontend decoder behavior:
+            # keep all earlier decoded records and stop cleanly if the file
+            # ends mid-record, which can happen for active .bin files or
+            # interrupted/incomplete files.
+            break
+
+        yield record_offset, rec, checkpoint_state
+        idx += 1
+
+
+def _record_max_ts(rec: dict) -> float:
+    max_ts = float("-inf")
+
+    for sample in rec["accel_samples"] or ():
+        if sample[0] > max_ts:
+            max_ts = sample[0]
+
+    inclin = rec["inclin"]
+    if inclin:
+        for sample in inclin if isinstance(inclin, list) else (inclin,):
+            if sample[0] > max_ts:
+                max_ts = sample[0]
+
+    temp = rec["temp"]
+    if temp and temp[0] > max_ts:
+        max_ts = temp[0]
+
+    return max_ts
+
+
+def _get_record_index(filepath: str, buf) -> dict:
+    """
+    Return the checkpoint index for one raw sensor file.
+
+    Each checkpoint is (max_ts_before, record_offset, state, record_index),
+    where max_ts_before is the largest sample timestamp in all earlier
+    records. It never decreases, so it can be bisected even if timestamps
+    within the file are not strictly ordered.
+    """
+    inode = os.stat(filepath).st_ino
+
+    with _RECORD_INDEX_LOCK:
+        index = _RECORD_INDEX_CACHE.get(filepath)
+        if index is not None and index["inode"] == inode and index["size"] <= len(buf):
+            return index
+
+        fv, pos = _read_format_version(buf)
+        index = {
+            "inode": inode,
+            "size": len(buf),
+            "format_version": fv,
+            "checkpoint_ts": [float("-inf")],
+            "checkpoints": [(float("-inf"), pos, _fresh_decode_state(), 0)],
+        }
+
+        for stale_path in [path for path in _RECORD_INDEX_CACHE if not os.path.exists(path)]:
+            del _RECORD_INDEX_CACHE[stale_path]
+        _RECORD_INDEX_CACHE.pop(filepath, None)
+        while len(_RECORD_INDEX_CACHE) >= _RECORD_INDEX_CACHE_MAX:
+            del _RECORD_INDEX_CACHE[next(iter(_RECORD_INDEX_CACHE))]
+        _RECORD_INDEX_CACHE[filepath] = index
+
+    return index
+
+
+def _iter_indexed_records(filepath: str, buf, start_ts: float):
+    if not buf:
+        return
+
+    index = _get_record_index(filepath, buf)
+
+    with _RECORD_INDEX_LOCK:
+        index["size"] = max(index["size"], len(buf))
+
+        # Last checkpoint whose earlier records all end before start_ts.
+        pos = bisect.bisect_left(index["checkpoint_ts"], start_ts) - 1
+        _, offset, checkpoint_state, idx = index["checkpoints"][pos]
+
+        # Checkpoints past the last known one are added while decoding, which
+        # needs the running max timestamp from that checkpoint onward.
+        running_max_ts, last_offset, _, _ = index["checkpoints"][-1]
+
+    records = _iter_records(
+        buf,
+        offset,
+        index["format_version"],
+        _copy_decode_state(checkpoint_state),
+        idx,
+    )
+
+    for record_offset, rec, new_checkpoint_state in records:
+        if record_offset > last_offset:
+            if new_checkpoint_state is not None:
+                with _RECORD_INDEX_LOCK:
+                    if record_offset > index["checkpoints"][-1][1]:
+                        index["checkpoint_ts"].append(running_max_ts)
+                        index["checkpoints"].append(
+                            (running_max_ts, record_offset, new_checkpoint_state, rec["record_index"])
+                        )
+                last_offset = record_offset
+            running_max_ts = max(running_max_ts, _record_max_ts(rec))
+        elif record_offset == last_offset:
+            running_max_ts = max(running_max_ts, _record_max_ts(rec))
+
+        yield rec
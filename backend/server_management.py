@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import shlex
+import socket
 import sqlite3
 import subprocess
 import time
@@ -83,8 +84,6 @@ def internet_reachable(timeout_seconds: float = 1.5) -> bool:
     """
     Lightweight outbound reachability check.
     """
-    import socket
-
     try:
         conn = socket.create_connection(("8.8.8.8", 53), timeout=timeout_seconds)
         conn.close()
@@ -1,5 +1,6 @@
 import json
 from pathlib import Path
+from threading import Lock
 
 from settings_schema import (
     DEFAULT_SETTINGS,
@@ -14,16 +15,40 @@ from settings_schema import (
 
 SETTINGS_JSON = Path("/home/pi/settings.json")
 
+# Last parsed settings, keyed by the file's (st_mtime_ns, st_size), so a read
+# with no intervening write is a stat() instead of a JSON parse + validation.
+_SETTINGS_CACHE = None
+_SETTINGS_LOCK = Lock()
+
 
 def save_settings(settings) -> None:
+    global _SETTINGS_CACHE
+
     SETTINGS_JSON.write_text(json.dumps(to_dict(settings), indent=2), encoding="utf-8")
 
+    with _SETTINGS_LOCK:
+        _SETTINGS_CACHE = None
+
 
 def load_settings():
-    if not SETTINGS_JSON.exists():
+    global _SETTINGS_CACHE
+
+    try:
+        st = SETTINGS_JSON.stat()
+    except FileNotFoundError:
         save_settings(DEFAULT_SETTINGS)
         return copy_deep(DEFAULT_SETTINGS)
 
+    key = (st.st_mtime_ns, st.st_size)
+
+    with _SETTINGS_LOCK:
+        cached = _SETTINGS_CACHE
+
+    # Callers edit the returned model in place before saving, so the cache
+    # holds plain data and every call gets a freshly validated model.
+    if cached is not None and cached[0] == key:
+        return validate_model(SettingsModel, cached[1])
+
     try:
         raw = json.loads(SETTINGS_JSON.read_text(encoding="utf-8"))
         parsed = validate_model(SettingsModel, raw)
@@ -32,11 +57,15 @@ def load_settings():
         merged.site_name = parsed.site_name
         merged.meta.update(parsed.meta)
         merged.config.update(parsed.config)
-        return merged
     except Exception:
         save_settings(DEFAULT_SETTINGS)
         return copy_deep(DEFAULT_SETTINGS)
 
+    with _SETTINGS_LOCK:
+        _SETTINGS_CACHE = (key, to_dict(merged))
+
+    return merged
+
 
 def get_site_name() -> str:
     settings = load_settings()
@@ -1,6 +1,8 @@
 import json
 import os
 import struct
+import threading
+import time
 from datetime import datetime
 import paho.mqtt.client as mqtt
 import queue
@@ -17,9 +19,23 @@ ACCEL_FORMAT = "<dfff"
 INCLIN_FORMAT = "<dfff"
 TEMP_FORMAT = "<df"
 
+_accel_batch_structs = {}
+_inclin_struct = struct.Struct(INCLIN_FORMAT)
+_temp_struct = struct.Struct(TEMP_FORMAT)
+
+# Each node/sensor file gets a preallocated ring that records are packed
+# straight into; the filled part goes to disk in one write when the ring is
+# full or on the flush timer, instead of opening the file for every sample.
+RING_SIZE = 64 * 1024
+FLUSH_INTERVAL_S = 0.25
+
 # Track current date
 current_date_str = None
 
+_rings = {}  # path -> [bytearray, bytes used]
+_open_files = {}
+_files_lock = threading.Lock()
+
 # Linear buffer
 data_buffer = queue.Queue()
 
@@ -33,9 +49,75 @@ def get_daily_filenames(node_id):
     return date_str, accel_file, inclin_file, temp_file
 
 
+def _accel_batch_struct(n):
+    """Struct for a whole accel batch, so it packs in one call instead of one per sample"""
+    packer = _accel_batch_structs.get(n)
+    if packer is None:
+        packer = struct.Struct("<" + ACCEL_FORMAT[1:] * n)
+        _accel_batch_structs[n] = packer
+    return packer
+
+
+# Append bytes to a daily file, opening it once. Caller holds _files_lock.
+def _append(path, data):
+    f = _open_files.get(path)
+    if f is None:
+        f = open(path, "ab", buffering=0)
+        _open_files[path] = f
+
+    view = memoryview(data)
+    while view:
+        view = view[f.write(view):]
+
+
+# Write the filled part of a ring in one call. Caller holds _files_lock.
+def _drain(path, ring):
+    if ring[1] == 0:
+        return
+
+    _append(path, memoryview(ring[0])[:ring[1]])
+    ring[1] = 0
+
+
+def _write(path, packer, *values):
+    with _files_lock:
+        ring = _rings.get(path)
+        if ring is None:
+            ring = _rings[path] = [bytearray(RING_SIZE), 0]
+
+        if ring[1] + packer.size > RING_SIZE:
+            _drain(path, ring)
+
+        # A batch larger than the whole ring goes straight to the file.
+        if packer.size > RING_SIZE:
+            _append(path, packer.pack(*values))
+            return
+
+        packer.pack_into(ring[0], ring[1], *values)
+        ring[1] += packer.size
+
+
+def _close_all_files():
+    with _files_lock:
+        for path, ring in _rings.items():
+            _drain(path, ring)
+        for f in _open_files.values():
+            f.close()
+        _open_files.clear()
+        _rings.clear()
+
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL_S)
+        with _files_lock:
+            for path, ring in _rings.items():
+                _drain(path, ring)
+
+
 def on_connect(client, userdata, flags, reason_code, properties):
     print("Connected with result code", reason_code)
-    client.subscribe(TOPIC)
+    client.subscribe(TOPIC, qos=0)
 
 
 def on_message(client, userdata, msg):
@@ -47,11 +129,12 @@ def on_message(client, userdata, msg):
 
     node_id = topic_parts[1]
 
-    data = json.loads(msg.payload.decode())
+    data = json.loads(msg.payload)
 
     today_str, accel_path, inclin_path, temp_path = get_daily_filenames(node_id)
 
     if today_str != current_date_str:
+        _close_all_files()
         current_date_str = today_str
         print(f"Switched to new daily files for {current_date_str}")
 
@@ -61,45 +144,42 @@ def on_message(client, userdata, msg):
     if "a" in data:
         accel_samples = data["a"]  #[[x,y,z], [x,y,z], ...]
 
-        with open(accel_path, "ab") as f:
-            for sample in accel_samples:
-                if len(sample) == 3:
-                    packet = struct.pack(
-                        ACCEL_FORMAT,
-                        timestamp,
-                        float(sample[0]),
-                        float(sample[1]),
-                        float(sample[2]),
-                    )
-                    with open(accel_path, "ab") as f:
-                        f.write(packet)
+        values = []
+        for sample in accel_samples:
+            if len(sample) == 3:
+                values += (timestamp, float(sample[0]), float(sample[1]), float(sample[2]))
+
+        _write(accel_path, _accel_batch_struct(len(values) // 4), *values)
 
     # --- Inclinometer ---
     if "i" in data:
-        packet = struct.pack(
-            INCLIN_FORMAT,
+        _write(
+            inclin_path,
+            _inclin_struct,
             timestamp,
             float(data["i"][0]),
             float(data["i"][1]),
             float(data["i"][2]),
         )
-        with open(inclin_path, "ab") as f:
-            f.write(packet)
 
     # --- Temperature ---
     if "T" in data:
-        packet = struct.pack(
-            TEMP_FORMAT,
+        _write(
+            temp_path,
+            _temp_struct,
             timestamp,
             float(data["T"]),
         )
-        with open(temp_path, "ab") as f:
-            f.write(packet)
 
 
 client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
 client.on_connect = on_connect
 client.on_message = on_message
 
+threading.Thread(target=_flush_loop, daemon=True).start()
+
 client.connect(BROKER_IP, PORT, 60)
-client.loop_forever()
\ No newline at end of file
+try:
+    client.loop_forever()
+finally:
+    _close_all_files()
\ No newline at end of file
@@ -1,9 +1,8 @@
 import time
 import math
 import random
-from datetime import datetime
+import struct
 import paho.mqtt.client as mqtt
-import json
 
 #HOST = "127.0.0.1"   # localhost
 # Priority order
@@ -15,6 +14,12 @@ HOST = "192.168.2.2"
 PORT = 1883
 TOPIC = "wind_turbine/data"
 
+# One sample per message as raw little-endian (t, ax, ay, az): 20 bytes
+# instead of a JSON object, and no json/float parsing on the subscriber.
+# t is int64 microseconds, matching the node .bin files.
+PACKER = struct.Struct("<qfff")
+TS_SCALE = 1_000_000
+
 client = mqtt.Client()
 client.connect(HOST, PORT, keepalive=60)
 
@@ -29,39 +34,40 @@ BASE_FREQ = 2.0              # Hz (rotor-related vibration)
 AMPLITUDE = 0.5              # g
 NOISE_STD = 0.02             # sensor noise (g)
 
-def generate_sample(t):
-    """Generate one 3-axis acceleration sample"""
-    ax = AMPLITUDE * math.sin(2 * math.pi * BASE_FREQ * t) + random.gauss(0, NOISE_STD)
-    ay = AMPLITUDE * math.sin(2 * math.pi * BASE_FREQ * t + math.pi/4) + random.gauss(0, NOISE_STD)
-    az = 1.0 + random.gauss(0, NOISE_STD)  # gravity + noise
-    return ax, ay, az
+def generate_window(samples):
+    """Generate the whole simulation window up front as (ax, ay, az) tuples"""
+    gauss = random.gauss
+    sin = math.sin
+    w = 2 * math.pi * BASE_FREQ
+    out = []
+    for i in range(samples):
+        phase = w * i * DT
+        out.append((
+            AMPLITUDE * sin(phase) + gauss(0, NOISE_STD),
+            AMPLITUDE * sin(phase + math.pi/4) + gauss(0, NOISE_STD),
+            1.0 + gauss(0, NOISE_STD),  # gravity + noise
+        ))
+    return out
 
 def main():
     try:
         print("timestamp,ax,ay,az")
 
-        start_time = time.time()
-        next_sample_time = start_time
         samples = int(SIM_DURATION * SAMPLING_FREQ)
+        window = generate_window(samples)
+        pack = PACKER.pack
+        publish = client.publish
 
-        for i in range(samples):
-            now = time.time()
-            t = now - start_time
-
-            ax, ay, az = generate_sample(t)
+        # Pace against a fixed monotonic schedule so sleep overshoot does
+        # not accumulate into drift.
+        start_time = time.monotonic()
 
+        for i, (ax, ay, az) in enumerate(window):
             timestamp = 1763899900
             print(f"{timestamp},{ax:.5f},{ay:.5f},{az:.5f}")
-            data = {
-                "t": timestamp,
-                "a": [ax,ay,az],
-                "ay": ay,
-                "az": az
-            }
-            client.publish(TOPIC, json.dumps(data))
+            publish(TOPIC, pack(timestamp * TS_SCALE, ax, ay, az))
 
-            next_sample_time += DT
-            sleep_time = next_sample_time - time.time()
+            sleep_time = start_time + (i + 1) * DT - time.monotonic()
             if sleep_time > 0:
                 time.sleep(sleep_time)
     except KeyboardInterrupt:
@@ -1,9 +1,9 @@
 import time
 import math
 import random
-from datetime import datetime
 import socket
-import json
+import struct
+import sys
 
 #HOST = "127.0.0.1"   # localhost
 # Priority order
@@ -16,56 +16,94 @@ PORT = 5000
 
 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 sock.connect((HOST, PORT))
+# Sends are already batched, so don't let Nagle hold back a batch.
+sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
 # Simulation parameters
 SAMPLING_FREQ = 200          # Hz
 DT = 1.0 / SAMPLING_FREQ
+DT_NS = 1_000_000_000 // SAMPLING_FREQ
 SIM_DURATION = 10            # seconds
 NODE_ID = 1
 
+# Fixed-size binary frame: epoch seconds, node id, ax, ay, az.
+# Must match FRAME in data_acq_sd.py.
+FRAME = struct.Struct("<dHfff")
+
+# Frames are packed into one buffer and sent SEND_BATCH at a time (100 ms).
+SEND_BATCH = 20
+
+# Console rows are formatted straight to bytes with a format bound once,
+# and written to stdout's binary buffer a send batch at a time.
+format_row = b"%.6f,%d,%.5f,%.5f,%.5f\n".__mod__
+
 # Vibration parameters (wind turbine-like)
 BASE_FREQ = 2.0              # Hz (rotor-related vibration)
 AMPLITUDE = 0.5              # g
 NOISE_STD = 0.02             # sensor noise (g)
 
-def generate_sample(t):
-    """Generate one 3-axis acceleration sample"""
-    ax = AMPLITUDE * math.sin(2 * math.pi * BASE_FREQ * t) + random.gauss(0, NOISE_STD)
-    ay = AMPLITUDE * math.sin(2 * math.pi * BASE_FREQ * t + math.pi/4) + random.gauss(0, NOISE_STD)
-    az = 1.0 + random.gauss(0, NOISE_STD)  # gravity + noise
-    return ax, ay, az
+def generate_window(samples):
+    """Generate the whole simulation window up front as (ax, ay, az) tuples"""
+    gauss = random.gauss
+    sin = math.sin
+    w = 2 * math.pi * BASE_FREQ
+    out = []
+    for i in range(samples):
+        phase = w * i * DT
+        out.append((
+            AMPLITUDE * sin(phase) + gauss(0, NOISE_STD),
+            AMPLITUDE * sin(phase + math.pi/4) + gauss(0, NOISE_STD),
+            1.0 + gauss(0, NOISE_STD),  # gravity + noise
+        ))
+    return out
 
 def main():
+    stdout = sys.stdout.buffer
+
+    out = bytearray(SEND_BATCH * FRAME.size)
+    used = 0
+    lines = bytearray()
+
+    def send_batch():
+        """Send the packed frames and print their rows"""
+        nonlocal used
+        if used:
+            sock.sendall(memoryview(out)[:used])
+            used = 0
+            stdout.write(lines)
+            stdout.flush()
+            lines.clear()
+
     try:
-        print("timestamp,node_id,ax,ay,az")
+        stdout.write(b"timestamp,node_id,ax,ay,az\n")
 
-        start_time = time.time()
-        next_sample_time = start_time
         samples = int(SIM_DURATION * SAMPLING_FREQ)
+        window = generate_window(samples)
+
+        # Pace against absolute integer-ns deadlines on the monotonic clock,
+        # so neither sleep overshoot nor float rounding accumulates.
+        deadline = time.monotonic_ns()
+
+        for ax, ay, az in window:
+            timestamp = time.time()
+            lines += format_row((timestamp, NODE_ID, ax, ay, az))
+            FRAME.pack_into(out, used, timestamp, NODE_ID, ax, ay, az)
+            used += FRAME.size
+            if used == len(out):
+                send_batch()
+
+            deadline += DT_NS
+            slack = deadline - time.monotonic_ns()
+            if slack > 0:
+                time.sleep(slack / 1e9)
 
-        for i in range(samples):
-            now = time.time()
-            t = now - start_time
-
-            ax, ay, az = generate_sample(t)
-
-            timestamp = datetime.utcnow().isoformat()
-            print(f"{timestamp},{NODE_ID},{ax:.5f},{ay:.5f},{az:.5f}")
-            data = {
-                "timestamp": timestamp,
-                "node id": NODE_ID,
-                "ax": ax,
-                "ay": ay,
-                "az": az
-            }
-            sock.sendall((json.dumps(data) + "\n").encode())
-
-            next_sample_time += DT
-            sleep_time = next_sample_time - time.time()
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+        send_batch()
     except KeyboardInterrupt:
-        print("Generator stopped.")
+        # Don't lose the partly filled batch on Ctrl-C.
+        send_batch()
+        # Same binary stream as the rows, so it can't overtake them.
+        stdout.write(b"Generator stopped.\n")
+        stdout.flush()
     finally:
         sock.close()
 
@@ -1,6 +1,7 @@
-import json
 import os
 import struct
+import threading
+import time
 from datetime import datetime
 import paho.mqtt.client as mqtt
 
@@ -17,12 +18,78 @@ ACCEL_FORMAT = "<dfff"
 INCLIN_FORMAT = "<dfff"
 TEMP_FORMAT = "<df"
 
+# Payload on TOPIC: one raw (t_us, ax, ay, az) sample per message.
+# Must match the publisher's PACKER in accel_mqtt_pub.py.
+PAYLOAD = struct.Struct("<qfff")
+TS_SCALE = 1_000_000
+
 ACCEL_SIZE = struct.calcsize(ACCEL_FORMAT)
 INCLIN_SIZE = struct.calcsize(INCLIN_FORMAT)
 TEMP_SIZE = struct.calcsize(TEMP_FORMAT)
 
+_accel_struct = struct.Struct(ACCEL_FORMAT)
+_inclin_struct = struct.Struct(INCLIN_FORMAT)
+_temp_struct = struct.Struct(TEMP_FORMAT)
+
+# Each daily file gets a preallocated ring that records are packed straight
+# into; the filled part goes to disk in one write when the ring is full or
+# on the flush timer, instead of opening the file for every packet.
+RING_SIZE = 64 * 1024
+FLUSH_INTERVAL_S = 0.25
+
 current_date_str = None
 
+_rings = {}  # path -> [bytearray, bytes used]
+_open_files = {}
+_files_lock = threading.Lock()
+
+
+# Write the filled part of a ring in one call. Caller holds _files_lock.
+def _drain(path, ring):
+    if ring[1] == 0:
+        return
+
+    f = _open_files.get(path)
+    if f is None:
+        f = open(path, "ab", buffering=0)
+        _open_files[path] = f
+
+    view = memoryview(ring[0])[:ring[1]]
+    while view:
+        view = view[f.write(view):]
+    ring[1] = 0
+
+
+def _write(path, packer, *values):
+    with _files_lock:
+        ring = _rings.get(path)
+        if ring is None:
+            ring = _rings[path] = [bytearray(RING_SIZE), 0]
+
+        if ring[1] + packer.size > RING_SIZE:
+            _drain(path, ring)
+
+        packer.pack_into(ring[0], ring[1], *values)
+        ring[1] += packer.size
+
+
+def _close_all_files():
+    with _files_lock:
+        for path, ring in _rings.items():
+            _drain(path, ring)
+        for f in _open_files.values():
+            f.close()
+        _open_files.clear()
+        _rings.clear()
+
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL_S)
+        with _files_lock:
+            for path, ring in _rings.items():
+                _drain(path, ring)
+
 
 def get_daily_filenames():
     date_str = datetime.now().strftime("%Y%m%d")
@@ -36,60 +103,38 @@ def get_daily_filenames():
 
 def on_connect(client, userdata, flags, reason_code, properties):
     print("Connected with result code", reason_code)
-    client.subscribe(TOPIC)
+    client.subscribe(TOPIC, qos=0)
 
 
 def on_message(client, userdata, msg):
     global current_date_str
 
-    data = json.loads(msg.payload.decode())
+    try:
+        ts_us, ax, ay, az = PAYLOAD.unpack(msg.payload)
+    except struct.error as exc:
+        print(f"Bad payload on {msg.topic}: {exc}")
+        return
 
     today_str, accel_path, inclin_path, temp_path = get_daily_filenames()
 
     if today_str != current_date_str:
+        _close_all_files()
         current_date_str = today_str
         print(f"Switched to new daily files for {current_date_str}")
 
-    timestamp = float(data["t"])
-
-    # --- Acceleration ---
-    if "a" in data:
-        accel_packet = struct.pack(
-            ACCEL_FORMAT,
-            timestamp,
-            float(data["a"][0]),
-            float(data["a"][1]),
-            float(data["a"][2]),
-        )
-        with open(accel_path, "ab") as f:
-            f.write(accel_packet)
-
-    # --- Inclinometer ---
-    if "i" in data:
-        inclin_packet = struct.pack(
-            INCLIN_FORMAT,
-            timestamp,
-            float(data["i"][0]),
-            float(data["i"][1]),
-            float(data["i"][2]),
-        )
-        with open(inclin_path, "ab") as f:
-            f.write(inclin_packet)
-
-    # --- Temperature ---
-    if "T" in data:
-        temp_packet = struct.pack(
-            TEMP_FORMAT,
-            timestamp,
-            float(data["T"]),
-        )
-        with open(temp_path, "ab") as f:
-            f.write(temp_packet)
+    # The publisher only sends acceleration; inclinometer and temperature
+    # come from real nodes on their own per-serial topics.
+    _write(accel_path, _accel_struct, ts_us / TS_SCALE, ax, ay, az)
 
 
 client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
 client.on_connect = on_connect
 client.on_message = on_message
 
+threading.Thread(target=_flush_loop, daemon=True).start()
+
 client.connect(BROKER_IP, PORT, 60)
-client.loop_forever()
\ No newline at end of file
+try:
+    client.loop_forever()
+finally:
+    _close_all_files()
\ No newline at end of file
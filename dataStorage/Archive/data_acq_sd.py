@@ -1,72 +1,132 @@
+import asyncio
 import socket
-import json
-import queue
-import threading
-import time
 import csv
 import os
+import struct
+from datetime import datetime, timezone
 
 HOST = "127.0.0.1"
 PORT = 5000
 
-BUFFER_SIZE = 100        # samples in RAM before writing
+RECV_BUFFER_SIZE = 64 * 1024  # bytes per socket read
+SOCKET_RCVBUF = 256 * 1024     # kernel receive buffer
 WRITE_INTERVAL = 0.1       # seconds
 DATA_PATH = "/home/pi/Data/accel_data.csv"  # microSD storage
+WRITE_BUFFERING = 1 << 20  # userland buffer for the CSV handle
+FSYNC_EVERY_TICKS = 50     # fsync once per this many write ticks
 
-data_buffer = queue.Queue()
+CSV_FIELDS = ("timestamp", "node id", "ax", "ay", "az")
+
+# Fixed-size binary frame, in CSV column order: epoch seconds, node id,
+# ax, ay, az. Must match FRAME in accel_simulator.py.
+FRAME = struct.Struct("<dHfff")
+
+# Rows received since the last write. The receiver and the writer both run
+# on the one asyncio loop, so the hand-off needs no lock or ring.
+data_buffer = []
 
 # ---------- Socket Receiver ----------
-def receive_data():
-    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    server.bind((HOST, PORT))
-    server.listen(1)
-    print("Receiver listening...")
+async def handle_connection(conn, addr):
+    loop = asyncio.get_running_loop()
 
-    conn, addr = server.accept()
-    print("Connected to generator")
+    # Receive straight into one preallocated buffer per connection and
+    # unpack every whole frame in it; only a partial last frame is carried
+    # over to the front for the next read.
+    buf = bytearray(RECV_BUFFER_SIZE - RECV_BUFFER_SIZE % FRAME.size)
+    view = memoryview(buf)
+    filled = 0
 
     with conn:
-        buffer = ""
         while True:
-            chunk = conn.recv(1024).decode()
-            if not chunk:
+            n = await loop.sock_recv_into(conn, view[filled:])
+            if not n:
                 break
+            filled += n
+
+            whole = filled - filled % FRAME.size
+            data_buffer.extend(FRAME.iter_unpack(view[:whole]))
+
+            if whole:
+                buf[:filled - whole] = view[whole:filled].tobytes()
+                filled -= whole
+
+    print(f"Generator {addr[0]}:{addr[1]} disconnected")
+
+
+async def serve():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    # Set before listen() so accepted connections inherit it.
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF)
+    server.bind((HOST, PORT))
+    server.listen()
+    server.setblocking(False)
+    print("Receiver listening...")
 
-            buffer += chunk
-            while "\n" in buffer:
-                line, buffer = buffer.split("\n", 1)
-                data_buffer.put(json.loads(line))
+    # One event loop serves every generator connection and the SD writer.
+    # If the writer fails, its exception ends serve() (and the process)
+    # instead of vanishing while received rows pile up unwritten.
+    await asyncio.gather(write_to_sd(), accept_connections(server))
+
+
+async def accept_connections(server):
+    loop = asyncio.get_running_loop()
+    tasks = set()
+    while True:
+        conn, addr = await loop.sock_accept(server)
+        conn.setblocking(False)
+        print(f"Connected to generator {addr[0]}:{addr[1]}")
+        task = asyncio.create_task(handle_connection(conn, addr))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
 
 
 # ---------- Writer to microSD ----------
-def write_to_sd():
+def format_row(row):
+    """Frame values -> CSV columns: naive UTC ISO timestamp (the format the
+    generator sent as JSON) and float32 readings to the simulator's 5 dp"""
+    ts, node_id, ax, ay, az = row
+    iso = datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None).isoformat()
+    return (iso, node_id, f"{ax:.5f}", f"{ay:.5f}", f"{az:.5f}")
+
+
+def write_rows(writer, f):
+    writer.writerows(map(format_row, data_buffer))
+    f.flush()
+    count = len(data_buffer)
+    data_buffer.clear()
+    return count
+
+
+async def write_to_sd():
     file_exists = os.path.isfile(DATA_PATH)
 
-    while True:
-        time.sleep(WRITE_INTERVAL)
+    # One handle for the whole run; rows arrive in CSV column order and are
+    # formatted as they are written.
+    f = open(DATA_PATH, "a", newline="", buffering=WRITE_BUFFERING)
+    writer = csv.writer(f)
+    if not file_exists:
+        writer.writerow(CSV_FIELDS)
+
+    ticks = 0
+    try:
+        while True:
+            await asyncio.sleep(WRITE_INTERVAL)
 
-        rows = []
-        while not data_buffer.empty() and len(rows) < BUFFER_SIZE:
-            rows.append(data_buffer.get())
+            if data_buffer:
+                count = write_rows(writer, f)
 
-        if rows:
-            with open(DATA_PATH, "a", newline="") as f:
-                writer = csv.DictWriter(
-                    f, fieldnames=["timestamp","node id", "ax", "ay", "az"]
-                )
-                if not file_exists:
-                    writer.writeheader()
-                    file_exists = True
-                writer.writerows(rows)
+                ticks += 1
+                if ticks % FSYNC_EVERY_TICKS == 0:
+                    os.fsync(f.fileno())
 
-            print(f"Wrote {len(rows)} samples to SD")
+                print(f"Wrote {count} samples to SD")
+    finally:
+        # Cancelled on shutdown: keep whatever arrived since the last tick.
+        write_rows(writer, f)
+        f.close()
 
 
 # ---------- Main ----------
 if __name__ == "__main__":
-    threading.Thread(target=receive_data, daemon=True).start()
-    threading.Thread(target=write_to_sd, daemon=True).start()
-
     print("Receiver running. Press Ctrl+C to stop.")
-    while True:
-        time.sleep(1)
+    asyncio.run(serve())
@@ -1,4 +1,6 @@
-import json
+import struct
+import threading
+import time
 import paho.mqtt.client as mqtt
 from collections import deque
 
@@ -7,25 +9,67 @@ PORT = 1883
 TOPIC = "wind_turbine/data"
 DATA_PATH = "/home/pi/Data/accel_data.csv"
 
+# Must match the publisher's PACKER in accel_mqtt_pub.py.
+PACKER = struct.Struct("<qfff")
+TS_SCALE = 1_000_000
+
 BUFFER_SIZE = 2000
 buffer = deque(maxlen=BUFFER_SIZE)
 
+# Lines accumulate in memory and go to the CSV, which stays open, in one
+# write per FLUSH_BYTES or FLUSH_INTERVAL_S.
+FLUSH_BYTES = 32 * 1024
+FLUSH_INTERVAL_S = 0.25
+
+_fh = open(DATA_PATH, "ab", buffering=1 << 20)
+_acc = bytearray()
+_lock = threading.Lock()
+
+# Write out accumulated lines. Caller holds _lock.
+def _flush_locked():
+    if _acc:
+        _fh.write(_acc)
+        _fh.flush()
+        _acc.clear()
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL_S)
+        with _lock:
+            _flush_locked()
+
 def on_connect(client, userdata, flags, rc):
     print("Connected to broker")
-    client.subscribe(TOPIC)
+    client.subscribe(TOPIC, qos=0)
 
 def on_message(client, userdata, msg):
-    data = json.loads(msg.payload.decode())
-    buffer.append(data)
+    try:
+        ts_us, ax, ay, az = PACKER.unpack(msg.payload)
+    except struct.error as exc:
+        print(f"Bad payload on {msg.topic}: {exc}")
+        return
+    # Float seconds on the subscriber side, as before the wire format moved
+    # to integer microseconds.
+    t = ts_us / TS_SCALE
+    buffer.append((t, ax, ay, az))
+
+    line = f"{t},{ax},{ay},{az}\n".encode()
 
-    # Simple file write (microSD)
-    with open(DATA_PATH, "a") as f:
-        f.write(f"{data['timestamp']},{data['ax']},{data['ay']},{data['az']}\n")
+    with _lock:
+        _acc.extend(line)
+        if len(_acc) >= FLUSH_BYTES:
+            _flush_locked()
 
 client = mqtt.Client()
 client.on_connect = on_connect
 client.on_message = on_message
 
+threading.Thread(target=_flush_loop, daemon=True).start()
 
 client.connect(BROKER_IP, PORT, keepalive=60)
-client.loop_forever()
+try:
+    client.loop_forever()
+finally:
+    with _lock:
+        _flush_locked()
+    _fh.close()
@@ -1,12 +1,19 @@
-import json
 import os
+import queue
 import struct
 import sys
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import paho.mqtt.client as mqtt
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # optional: the stdlib parser also accepts bytes
+    from json import loads as json_loads
+
 BACKEND_DIR = Path(__file__).resolve().parents[1] / "backend"
 sys.path.insert(0, str(BACKEND_DIR))
 
@@ -23,15 +30,115 @@ DATA_DIR = "/home/pi/Data"
 
 current_date_str = None
 current_file_path = None
+# Epoch seconds at which the current local day ends; until then the daily
+# filename is reused instead of being recomputed per message.
+current_day_end_ts = 0.0
 
 PACKET_FORMAT = "<dfff"
-PACKET_SIZE = struct.calcsize(PACKET_FORMAT)
+_PACKER = struct.Struct(PACKET_FORMAT)
+PACKET_SIZE = _PACKER.size
+
+# Packets are packed into a preallocated buffer, which is handed off per
+# BATCH_PACKETS or FLUSH_INTERVAL_S to a writer thread that appends it to
+# the daily file, so ingest never waits on the SD card. Up to
+# WRITE_QUEUE_DEPTH batches can be in flight before ingest blocks.
+BATCH_PACKETS = 4096
+FLUSH_INTERVAL_S = 0.25
+WRITE_QUEUE_DEPTH = 4
+# Written data is synced and dropped from the page cache every this many
+# bytes; it is never read back here, and a growing dirty cache ends in
+# long writeback stalls on the SD card.
+DROP_CACHE_BYTES = 16 << 20
+
+_fd = None
+_accum = bytearray(BATCH_PACKETS * PACKET_SIZE)
+_accum_used = 0
+_write_lock = threading.Lock()
+
+# Raw (topic, payload) pairs from the MQTT network thread to the ingest
+# worker, which does the registry update, parsing and packing. Bounded, and
+# never waited on from the network thread: when the worker falls behind,
+# new messages are dropped and counted rather than stalling paho.
+INBOX_SIZE = 8192
+SHUTDOWN_TIMEOUT_S = 5
+_inbox = queue.Queue(maxsize=INBOX_SIZE)
+_inbox_dropped = 0
+
+_pending = queue.Queue()  # (fd, buffer, bytes used); buffer None closes fd
+_spare = queue.Queue()
+for _ in range(WRITE_QUEUE_DEPTH):
+    _spare.put(bytearray(BATCH_PACKETS * PACKET_SIZE))
 
 
 def get_daily_filename():
-    date_str = datetime.now().strftime("%Y%m%d")
+    now = datetime.now()
+    date_str = now.strftime("%Y%m%d")
     filename = f"accel_data_{date_str}.bin"
-    return date_str, os.path.join(DATA_DIR, filename)
+    day_end = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return date_str, os.path.join(DATA_DIR, filename), day_end.timestamp()
+
+
+def _drop_cached(fd):
+    # DONTNEED only evicts clean pages, so write the data back first.
+    os.fsync(fd)
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _writer_loop():
+    unsynced = 0
+    while True:
+        fd, buf, used = _pending.get()
+        try:
+            if buf is None:
+                unsynced = 0
+                try:
+                    _drop_cached(fd)
+                finally:
+                    os.close(fd)
+            else:
+                view = memoryview(buf)[:used]
+                while view:
+                    view = view[os.write(fd, view):]
+
+                unsynced += used
+                if unsynced >= DROP_CACHE_BYTES:
+                    unsynced = 0
+                    _drop_cached(fd)
+        except Exception as exc:
+            # Log and carry on: a dead writer would leave ingest waiting on
+            # _spare forever.
+            print(f"Binary write failed: {exc}")
+        finally:
+            if buf is not None:
+                _spare.put(buf)
+            _pending.task_done()
+
+
+# Hand accumulated packets to the writer. Caller holds _write_lock.
+def _flush_locked():
+    global _accum, _accum_used
+
+    if _accum_used and _fd is not None:
+        _pending.put((_fd, _accum, _accum_used))
+        _accum = _spare.get()
+        _accum_used = 0
+
+
+def _close_file_locked():
+    global _fd
+
+    _flush_locked()
+    if _fd is not None:
+        _pending.put((_fd, None, 0))
+        _fd = None
+
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL_S)
+        with _write_lock:
+            _flush_locked()
 
 
 def on_connect(client, userdata, flags, reason_code, properties=None):
@@ -41,34 +148,48 @@ def on_connect(client, userdata, flags, reason_code, properties=None):
 
 
 def on_message(client, userdata, msg):
-    global current_date_str, current_file_path
+    global _inbox_dropped
+
+    try:
+        _inbox.put_nowait((msg.topic, msg.payload))
+    except queue.Full:
+        _inbox_dropped += 1
+        if _inbox_dropped % 1000 == 1:
+            print(f"Ingest backlog full, {_inbox_dropped} messages dropped so far")
+
+
+def _ingest_loop():
+    while True:
+        item = _inbox.get()
+        if item is None:
+            return
+        try:
+            ingest(*item)
+        except Exception as exc:
+            print(f"Ingest failed for {item[0]}: {exc}")
+
+
+def ingest(topic, payload):
+    global current_date_str, current_file_path, current_day_end_ts, _fd, _accum_used
 
     try:
-        serial = serial_from_topic(msg.topic)
+        serial = serial_from_topic(topic)
         node_info = register_serial(serial)
     except Exception as exc:
-        print(f"Topic parse / registry update failed for {msg.topic}: {exc}")
+        print(f"Topic parse / registry update failed for {topic}: {exc}")
         return
 
-    if msg.topic.endswith("/status"):
+    if topic.endswith("/status"):
         return
 
     try:
-        data = json.loads(msg.payload.decode())
+        data = json_loads(payload)
     except Exception as exc:
-        print(f"JSON decode failed for {msg.topic}: {exc}")
+        print(f"JSON decode failed for {topic}: {exc}")
         return
 
-    today_str, file_path = get_daily_filename()
-
-    if today_str != current_date_str:
-        current_date_str = today_str
-        current_file_path = file_path
-        print(f"Switched to new daily binary file: {current_file_path}")
-
     try:
-        packet = struct.pack(
-            PACKET_FORMAT,
+        values = (
             float(data["timestamp"]),
             float(data["ax"]),
             float(data["ay"]),
@@ -78,12 +199,42 @@ def on_message(client, userdata, msg):
         print(f"Binary pack failed for {node_info['label']}: {exc}")
         return
 
-    with open(current_file_path, "ab") as f:
-        f.write(packet)
+    with _write_lock:
+        if time.time() >= current_day_end_ts:
+            today_str, file_path, current_day_end_ts = get_daily_filename()
+            if today_str != current_date_str:
+                _close_file_locked()
+                current_date_str = today_str
+                current_file_path = file_path
+                print(f"Switched to new daily binary file: {current_file_path}")
+
+        if _fd is None:
+            _fd = os.open(current_file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+        _PACKER.pack_into(_accum, _accum_used, *values)
+        _accum_used += PACKET_SIZE
+        if _accum_used == len(_accum):
+            _flush_locked()
 
 
 client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
 client.on_connect = on_connect
 client.on_message = on_message
+
+threading.Thread(target=_writer_loop, daemon=True).start()
+ingest_thread = threading.Thread(target=_ingest_loop, daemon=True)
+ingest_thread.start()
+threading.Thread(target=_flush_loop, daemon=True).start()
+
 client.connect(BROKER_IP, PORT, 60)
-client.loop_forever()
\ No newline at end of file
+try:
+    client.loop_forever()
+finally:
+    try:
+        _inbox.put(None, timeout=SHUTDOWN_TIMEOUT_S)
+    except queue.Full:
+        print("Ingest backlog did not drain; closing with messages still queued")
+    ingest_thread.join(timeout=SHUTDOWN_TIMEOUT_S)
+    with _write_lock:
+        _close_file_locked()
+    _pending.join()
\ No newline at end of file
@@ -714,7 +714,7 @@ def handle_status_message(topic: str, payload_bytes: bytes) -> None:
             print(f"[status] Node not found for serial {serial}")
             return
 
-        payload = json.loads(payload_bytes.decode())
+        payload = json.loads(payload_bytes)
         current_state = str(payload.get("state") or "unknown")
         acked_at = now_iso()
 
@@ -761,7 +761,7 @@ def handle_fault_message(topic: str, payload_bytes: bytes) -> None:
         # Keep registry activity fresh for fault traffic.
         register_serial(serial)
 
-        data = json.loads(payload_bytes.decode())
+        data = json.loads(payload_bytes)
 
         ts = data.get("ts")
         faults = data.get("f")
@@ -839,7 +839,7 @@ def on_message(client, userdata, msg):
         write_raw(node_id, msg.payload)
 
         # Parse the JSON payload.
-        data = json.loads(msg.payload.decode())
+        data = json.loads(msg.payload)
 
         # Update live sensor health from MQTT packet contents.
         update_sensor_health_from_packet(node_id, data)
@@ -59,6 +59,15 @@ TS_SCALE = 1_000_000    # seconds  -> µs
 
 FILE_FORMAT_VERSION = 3
 
+# Field packers, compiled once instead of re-parsing the format string on
+# every sample.
+_PACK_U8 = struct.Struct("<B").pack
+_PACK_U8X2 = struct.Struct("<BB").pack
+_PACK_I16 = struct.Struct("<h").pack
+_PACK_I32 = struct.Struct("<i").pack
+_PACK_I32X3 = struct.Struct("<iii").pack
+_PACK_I64 = struct.Struct("<q").pack
+
 MAX_DELTA_S = 60.0
 ABSOLUTE_RECORD_INTERVAL_S = 60.0
 INT16_MAX = 32767
@@ -370,11 +379,11 @@ def needs_absolute_record(data: dict, state: dict) -> tuple[bool, str]:
 def _abs_ts_bytes(ts_s: float, ss: dict) -> bytes:
     ts_us = int(ts_s * TS_SCALE)
     ss["ts_us"] = ts_us
-    return struct.pack("<q", ts_us)
+    return _PACK_I64(ts_us)
 
 
 def _pack_delta(value: int) -> bytes:
-    return struct.pack("<h", max(-32768, min(32767, value)))
+    return _PACK_I16(max(-32768, min(32767, value)))
 
 
 def _read_exact_or_raise(f, n: int, label: str = "") -> bytes:
@@ -498,14 +507,14 @@ def encode_first_record(data: dict, state: dict) -> bytes:
     if "a" in data and len(data["a"]) > 0:
         header |= 0x01
         samples = data["a"]
-        body += struct.pack("<B", len(samples))
+        body += _PACK_U8(len(samples))
         prev = list(state["accel"]["xyz_prev"])
         for s in samples:
             xi, hx = _encode_abs_component(s[1], ACCEL_SCALE)
             yi, hy = _encode_abs_component(s[2], ACCEL_SCALE)
             zi, hz = _encode_abs_component(s[3], ACCEL_SCALE)
             body += _abs_ts_bytes(float(s[0]), state["accel"])
-            body += struct.pack("<iii", xi, yi, zi)
+            body += _PACK_I32X3(xi, yi, zi)
             if hx:
                 prev[0] = xi
             if hy:
@@ -517,14 +526,14 @@ def encode_first_record(data: dict, state: dict) -> bytes:
     if "i" in data and len(data["i"]) > 0:
         header |= 0x02
         samples = data["i"]
-        body += struct.pack("<B", len(samples))
+        body += _PACK_U8(len(samples))
         prev = list(state["inclin"]["xyz_prev"])
         for s in samples:
             ri, hr = _encode_abs_component(s[1], INCLIN_SCALE)
             pi, hp = _encode_abs_component(s[2], INCLIN_SCALE)
             yi, hy = _encode_abs_component(s[3], INCLIN_SCALE)
             body += _abs_ts_bytes(float(s[0]), state["inclin"])
-            body += struct.pack("<iii", ri, pi, yi)
+            body += _PACK_I32X3(ri, pi, yi)
             if hr:
                 prev[0] = ri
             if hp:
@@ -538,11 +547,11 @@ def encode_first_record(data: dict, state: dict) -> bytes:
         tv = data["T"]
         vi, have_val = _encode_abs_component(tv[1], TEMP_SCALE)
         body += _abs_ts_bytes(float(tv[0]), state["temp"])
-        body += struct.pack("<i", vi)
+        body += _PACK_I32(vi)
         if have_val:
             state["temp"]["val_prev"] = vi
 
-    return struct.pack("<BB", 0xFF, header) + bytes(body)
+    return _PACK_U8X2(0xFF, header) + bytes(body)
 
 
 def encode_delta_record(data: dict, state: dict) -> bytes:
@@ -553,7 +562,7 @@ def encode_delta_record(data: dict, state: dict) -> bytes:
     if "a" in data and len(data["a"]) > 0:
         header |= 0x01
         samples = data["a"]
-        body += struct.pack("<B", len(samples))
+        body += _PACK_U8(len(samples))
         prev = list(state["accel"]["xyz_prev"])
         ss = state["accel"]
 
@@ -596,9 +605,9 @@ def encode_delta_record(data: dict, state: dict) -> bytes:
                 if dz != 0:
                     changed |= CHANGED_Z
 
-            body += struct.pack("<B", changed)
+            body += _PACK_U8(changed)
             if changed & CHANGED_TS:
-                body += struct.pack("<i", delta_us)
+                body += _PACK_I32(delta_us)
             if changed & CHANGED_X:
                 body += _pack_delta(dx)
             if changed & CHANGED_Y:
@@ -619,7 +628,7 @@ def encode_delta_record(data: dict, state: dict) -> bytes:
     if "i" in data and len(data["i"]) > 0:
         header |= 0x02
         samples = data["i"]
-        body += struct.pack("<B", len(samples))
+        body += _PACK_U8(len(samples))
         prev = list(state["inclin"]["xyz_prev"])
         ss = state["inclin"]
 
@@ -662,9 +671,9 @@ def encode_delta_record(data: dict, state: dict) -> bytes:
                 if dy != 0:
                     changed |= CHANGED_Z
 
-            body += struct.pack("<B", changed)
+            body += _PACK_U8(changed)
             if changed & CHANGED_TS:
-                body += struct.pack("<i", delta_us)
+                body += _PACK_I32(delta_us)
             if changed & CHANGED_X:
                 body += _pack_delta(dr)
             if changed & CHANGED_Y:
@@ -706,15 +715,15 @@ def encode_delta_record(data: dict, state: dict) -> bytes:
 
         if not is_frozen:
             header |= 0x04
-            body += struct.pack("<B", changed)
+            body += _PACK_U8(changed)
             if changed & CHANGED_TS:
-                body += struct.pack("<i", delta_us)
+                body += _PACK_I32(delta_us)
             if changed & CHANGED_X:
                 body += _pack_delta(dt)
             if not val_is_nan:
                 ss["val_prev"] += dt
 
-    return struct.pack("<B", header) + bytes(body)
+    return _PACK_U8(header) + bytes(body)
 
 
 def _packet_max_ts_us(data: dict) -> int:
@@ -811,7 +820,7 @@ def write_record(node_id: str, data: dict):
         try:
             with open(filepath, "ab") as f:
                 if not state["header_written"]:
-                    f.write(struct.pack("<B", FILE_FORMAT_VERSION))
+                    f.write(_PACK_U8(FILE_FORMAT_VERSION))
                     state["header_written"] = True
                 f.write(record)
         except OSError as e:
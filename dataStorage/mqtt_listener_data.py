@@ -35,7 +35,7 @@ def handle_status_message(topic: str, payload_bytes: bytes) -> None:
             print(f"[status] Node not found for serial {serial}")
             return
 
-        payload = json.loads(payload_bytes.decode())
+        payload = json.loads(payload_bytes)
         current_state = str(payload.get("state") or "unknown")
         acked_at = now_iso()
 
@@ -71,7 +71,7 @@ def handle_fault_message(topic: str, payload_bytes: bytes) -> None:
     try:
         serial = serial_from_topic(topic)
         register_serial(serial)
-        data = json.loads(payload_bytes.decode())
+        data = json.loads(payload_bytes)
 
         ts = data.get("ts")
         faults = data.get("f")
@@ -99,9 +99,9 @@ def on_connect(client, userdata, flags, reason_code, properties):
         print(f"[MQTT] Connection failed: reason_code={reason_code} — will retry automatically")
         return
 
-    client.subscribe(TOPIC)
-    client.subscribe(STATUS_TOPIC)
-    client.subscribe(FAULT_TOPIC)
+    client.subscribe(TOPIC, qos=0)
+    client.subscribe(STATUS_TOPIC, qos=0)
+    client.subscribe(FAULT_TOPIC, qos=0)
 
 
 def on_disconnect(client, userdata, flags, reason_code, properties):
@@ -135,7 +135,7 @@ def on_message(client, userdata, msg):
         register_serial(node_id)
         write_raw(node_id, msg.payload)
 
-        data = json.loads(msg.payload.decode())
+        data = json.loads(msg.payload)
 
         if not normalise_sensor_timestamps(data, node_id):
             return
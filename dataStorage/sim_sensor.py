@@ -180,7 +180,7 @@ class NodePublisher(threading.Thread):
                 if self.enable_temp:
                     packet["T"] = self.sim.temperature()
 
-                payload = json.dumps(packet)
+                payload = json.dumps(packet, separators=(",", ":"))
                 self.client.publish(self.topic, payload, qos=0)
                 sent += 1
 
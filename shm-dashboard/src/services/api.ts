@@ -220,6 +220,29 @@ export type ApiResponse =
   | InclinometerPlotResponse
   | TemperaturePlotResponse;
 
+/*
+  Plot endpoints send one array per field ({ ts: [...], x: [...], ... })
+  instead of one object per point, which keeps the payload small. The
+  columns are expanded back into point objects once, here.
+*/
+type PlotColumns = { ts: string[] } & Record<string, unknown[]>;
+
+type PlotColumnsResponse = Omit<ApiResponse, "points"> & {
+  columns: PlotColumns;
+};
+
+function pointsFromColumns(columns: PlotColumns) {
+  const names = Object.keys(columns).filter((name) => name !== "ts");
+
+  return columns.ts.map((ts, index) => {
+    const point: Record<string, unknown> = { ts };
+    for (const name of names) {
+      point[name] = columns[name][index];
+    }
+    return point;
+  });
+}
+
 export type SettingsResponse = {
   site_name?: string;
   meta: Record<string, unknown>;
@@ -399,7 +422,7 @@ export function putSiteName(
   });
 }
 
-export function getSensorData(
+export async function getSensorData(
   endpoint: string,
   params: { node: number; minutes: number },
   signal?: AbortSignal
@@ -408,7 +431,12 @@ export function getSensorData(
   qs.set("node", String(params.node));
   qs.set("minutes", String(params.minutes));
 
-  return request<ApiResponse>(`${endpoint}?${qs.toString()}`, { signal });
+  const { columns, ...rest } = await request<PlotColumnsResponse>(
+    `${endpoint}?${qs.toString()}`,
+    { signal }
+  );
+
+  return { ...rest, points: pointsFromColumns(columns) } as ApiResponse;
 }
 
 export type FaultRow = {